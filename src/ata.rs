@@ -0,0 +1,340 @@
+//! ATA commands sent in process through the Linux SCSI generic ioctl
+//! See <https://tldp.org/HOWTO/SCSI-Generic-HOWTO/sg_io_hdr_t.html>
+//! and ATA PASS-THROUGH (16) from the SAT specification
+
+use std::{
+    fs::{File, OpenOptions},
+    os::{
+        fd::AsRawFd as _,
+        raw::{c_int, c_uchar, c_uint, c_ushort, c_void},
+        unix::fs::OpenOptionsExt as _,
+    },
+    path::Path,
+    ptr,
+};
+
+use nix::libc::O_NONBLOCK;
+
+/// `SG_IO` ioctl request number
+const SG_IO: u32 = 0x2285;
+
+/// Command timeout in milliseconds, some drives may need to spin up to reply
+const TIMEOUT_MS: c_uint = 15_000;
+
+/// ATA PASS-THROUGH (16) SCSI opcode
+const ATA_16: u8 = 0x85;
+
+/// ATA CHECK POWER MODE command
+const ATA_CHECK_POWER_MODE: u8 = 0xe5;
+
+/// ATA IDENTIFY DEVICE command
+const ATA_IDENTIFY_DEVICE: u8 = 0xec;
+
+/// ATA SMART command
+const ATA_SMART: u8 = 0xb0;
+
+/// ATA SMART READ DATA feature
+const ATA_SMART_READ_DATA: u8 = 0xd0;
+
+/// ATA status register error bit
+const ATA_STATUS_ERR: u8 = 0x01;
+
+/// Size of a sector transferred by PIO data-in commands
+const SECTOR_LEN: usize = 512;
+
+/// Size of the SMART data structure
+pub(crate) const SMART_DATA_LEN: usize = SECTOR_LEN;
+
+/// Sense buffer size
+const SENSE_LEN: usize = 32;
+
+/// Sense buffer
+type Sense = [u8; SENSE_LEN];
+
+/// Linux `sg_io_hdr_t`, see `<scsi/sg.h>`
+#[repr(C)]
+struct SgIoHdr {
+    /// Always 'S'
+    interface_id: c_int,
+    /// Data transfer direction
+    dxfer_direction: c_int,
+    /// SCSI command length
+    cmd_len: c_uchar,
+    /// Max length to write to sense buffer
+    mx_sb_len: c_uchar,
+    /// Scatter gather elements count
+    iovec_count: c_ushort,
+    /// Data transfer length
+    dxfer_len: c_uint,
+    /// Data transfer buffer
+    dxferp: *mut c_void,
+    /// SCSI command
+    cmdp: *const c_uchar,
+    /// Sense buffer
+    sbp: *mut c_uchar,
+    /// Timeout in milliseconds
+    timeout: c_uint,
+    /// Flags
+    flags: c_uint,
+    /// Unused internal id
+    pack_id: c_int,
+    /// Unused user pointer
+    usr_ptr: *mut c_void,
+    /// SCSI status
+    status: c_uchar,
+    /// Shifted SCSI status
+    masked_status: c_uchar,
+    /// Messaging level data
+    msg_status: c_uchar,
+    /// Bytes actually written to sense buffer
+    sb_len_wr: c_uchar,
+    /// Host adapter errors
+    host_status: c_ushort,
+    /// Driver errors
+    driver_status: c_ushort,
+    /// Residual count
+    resid: c_int,
+    /// Command duration in milliseconds
+    duration: c_uint,
+    /// Auxiliary information
+    info: c_uint,
+}
+
+nix::ioctl_readwrite_bad!(sg_io, SG_IO, SgIoHdr);
+
+/// Transfer direction for a pass through command
+enum Transfer<'a> {
+    /// No data
+    None,
+    /// Data read from device
+    FromDevice(&'a mut [u8]),
+}
+
+/// Open block device to send it commands, without blocking if no media is present
+pub(crate) fn open(path: &Path) -> anyhow::Result<File> {
+    Ok(OpenOptions::new()
+        .read(true)
+        .custom_flags(O_NONBLOCK)
+        .open(path)?)
+}
+
+/// Send ATA PASS-THROUGH (16) command, and return sense buffer
+fn pass_through(dev: &File, cdb: &[u8; 16], transfer: Transfer) -> anyhow::Result<Sense> {
+    /// No data transfer
+    const SG_DXFER_NONE: c_int = -1;
+    /// Data transfer from device
+    const SG_DXFER_FROM_DEV: c_int = -3;
+
+    let mut sense: Sense = [0; SENSE_LEN];
+    let (dxfer_direction, dxferp, dxfer_len) = match transfer {
+        Transfer::None => (SG_DXFER_NONE, ptr::null_mut(), 0),
+        Transfer::FromDevice(buf) => (
+            SG_DXFER_FROM_DEV,
+            buf.as_mut_ptr().cast::<c_void>(),
+            c_uint::try_from(buf.len())?,
+        ),
+    };
+    let mut hdr = SgIoHdr {
+        interface_id: c_int::from(b'S'),
+        dxfer_direction,
+        #[expect(clippy::cast_possible_truncation)]
+        cmd_len: cdb.len() as c_uchar,
+        #[expect(clippy::cast_possible_truncation)]
+        mx_sb_len: SENSE_LEN as c_uchar,
+        iovec_count: 0,
+        dxfer_len,
+        dxferp,
+        cmdp: cdb.as_ptr(),
+        sbp: sense.as_mut_ptr(),
+        timeout: TIMEOUT_MS,
+        flags: 0,
+        pack_id: 0,
+        usr_ptr: ptr::null_mut(),
+        status: 0,
+        masked_status: 0,
+        msg_status: 0,
+        sb_len_wr: 0,
+        host_status: 0,
+        driver_status: 0,
+        resid: 0,
+        duration: 0,
+        info: 0,
+    };
+    // SAFETY: the header pointers reference the command, sense and data buffers,
+    // which all outlive the call, and whose lengths are set accordingly
+    unsafe { sg_io(dev.as_raw_fd(), &raw mut hdr) }?;
+    anyhow::ensure!(
+        hdr.host_status == 0,
+        "SG_IO failed with host status {:#x}",
+        hdr.host_status
+    );
+    Ok(sense)
+}
+
+/// Get ATA registers from ATA Status Return sense data descriptor, if any
+fn status_descriptor(sense: &Sense) -> Option<&[u8]> {
+    /// Descriptor format sense data response code
+    const DESC_SENSE: u8 = 0x72;
+    /// ATA Status Return descriptor code
+    const ATA_STATUS_RETURN: u8 = 0x09;
+
+    if (sense[0] & 0x7f) != DESC_SENSE || sense[7] < 14 {
+        return None;
+    }
+    let desc = &sense[8..22];
+    (desc[0] == ATA_STATUS_RETURN && desc[1] >= 0x0c).then_some(desc)
+}
+
+/// Query drive power mode with ATA CHECK POWER MODE, and return the sector count register
+pub(crate) fn check_power_mode(dev: &File) -> anyhow::Result<u8> {
+    let mut cdb = [0; 16];
+    cdb[0] = ATA_16;
+    // Protocol: non-data
+    cdb[1] = 3 << 1;
+    // CK_COND, to get registers back in sense data
+    cdb[2] = 0x20;
+    cdb[14] = ATA_CHECK_POWER_MODE;
+    let sense = pass_through(dev, &cdb, Transfer::None)?;
+    let desc = status_descriptor(&sense)
+        .ok_or_else(|| anyhow::anyhow!("Missing ATA status in sense data"))?;
+    anyhow::ensure!(
+        desc[13] & ATA_STATUS_ERR == 0,
+        "CHECK POWER MODE failed with error {:#x}",
+        desc[3]
+    );
+    Ok(desc[5])
+}
+
+/// Build ATA PASS-THROUGH (16) command reading a single sector with PIO data-in
+fn pio_read_cdb(command: u8) -> [u8; 16] {
+    let mut cdb = [0; 16];
+    cdb[0] = ATA_16;
+    // Protocol: PIO data-in
+    cdb[1] = 4 << 1;
+    // T_DIR from device, BYT_BLOK, T_LENGTH in sector count
+    cdb[2] = 0x0e;
+    cdb[6] = 1;
+    cdb[14] = command;
+    cdb
+}
+
+/// Send PIO data-in command, and return the sector read
+fn pio_read(dev: &File, cdb: &[u8; 16], name: &str) -> anyhow::Result<[u8; SECTOR_LEN]> {
+    let mut data = [0; SECTOR_LEN];
+    let sense = pass_through(dev, cdb, Transfer::FromDevice(&mut data))?;
+    if let Some(desc) = status_descriptor(&sense) {
+        anyhow::ensure!(
+            desc[13] & ATA_STATUS_ERR == 0,
+            "{name} failed with error {:#x}",
+            desc[3]
+        );
+    } else {
+        anyhow::ensure!(
+            sense[0] == 0,
+            "{name} failed with sense key {:#x}",
+            sense[2] & 0x0f
+        );
+    }
+    Ok(data)
+}
+
+/// Read SMART data structure with ATA SMART READ DATA
+pub(crate) fn smart_read_data(dev: &File) -> anyhow::Result<[u8; SMART_DATA_LEN]> {
+    let mut cdb = pio_read_cdb(ATA_SMART);
+    cdb[4] = ATA_SMART_READ_DATA;
+    cdb[10] = 0x4f;
+    cdb[12] = 0xc2;
+    pio_read(dev, &cdb, "SMART READ DATA")
+}
+
+/// Get drive model number with ATA IDENTIFY DEVICE
+pub(crate) fn identify_model(dev: &File) -> anyhow::Result<String> {
+    let data = pio_read(dev, &pio_read_cdb(ATA_IDENTIFY_DEVICE), "IDENTIFY DEVICE")?;
+    identify_data_model(&data)
+}
+
+/// Get model number from IDENTIFY DEVICE data
+fn identify_data_model(data: &[u8; SECTOR_LEN]) -> anyhow::Result<String> {
+    // Words 27 to 46, with the bytes of each word swapped
+    let model: Vec<u8> = data[54..94]
+        .chunks_exact(2)
+        .flat_map(|w| [w[1], w[0]])
+        .collect();
+    let model = String::from_utf8(model)?.trim().to_owned();
+    anyhow::ensure!(!model.is_empty(), "Empty model number");
+    Ok(model)
+}
+
+/// Get temperature from the raw value of the first temperature attribute in a SMART data structure
+pub(crate) fn smart_attrib_temp(data: &[u8; SMART_DATA_LEN]) -> Option<u8> {
+    /// Known temp attributes ids
+    const TEMP_ATTRIB_IDS: [u8; 2] = [194, 190];
+    /// Attribute entry size
+    const ATTRIB_LEN: usize = 12;
+    /// Attribute table size
+    const ATTRIB_COUNT: usize = 30;
+
+    data[2..2 + ATTRIB_LEN * ATTRIB_COUNT]
+        .chunks_exact(ATTRIB_LEN)
+        .find(|a| TEMP_ATTRIB_IDS.contains(&a[0]))
+        // First raw value byte
+        .map(|a| a[5])
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_status_descriptor() {
+        let mut sense: Sense = [0; SENSE_LEN];
+        assert!(status_descriptor(&sense).is_none());
+
+        sense[..22].copy_from_slice(&[
+            0x72, 0x01, 0x00, 0x1d, 0x00, 0x00, 0x00, 0x0e, 0x09, 0x0c, 0x00, 0x00, 0x00, 0xff,
+            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x50,
+        ]);
+        let desc = status_descriptor(&sense).unwrap();
+        assert_eq!(desc[5], 0xff);
+        assert_eq!(desc[13] & ATA_STATUS_ERR, 0);
+
+        // Fixed format sense data
+        sense[0] = 0x70;
+        assert!(status_descriptor(&sense).is_none());
+    }
+
+    #[test]
+    fn test_identify_data_model() {
+        let mut data = [0; SECTOR_LEN];
+        data[54..94].copy_from_slice(b"DW CDW0430ZFXE0-Z0S40A                  ");
+        assert_eq!(
+            identify_data_model(&data).unwrap(),
+            "WDC WD4003FZEX-00Z4SA0"
+        );
+
+        data[54..94].fill(b' ');
+        assert!(identify_data_model(&data).is_err());
+    }
+
+    #[test]
+    fn test_smart_attrib_temp() {
+        let mut data = [0; SMART_DATA_LEN];
+        assert_eq!(smart_attrib_temp(&data), None);
+
+        // 9 Power_On_Hours
+        data[2..14].copy_from_slice(&[9, 0x32, 0, 100, 100, 0xbb, 0x06, 0, 0, 0, 0, 0]);
+        assert_eq!(smart_attrib_temp(&data), None);
+
+        // 190 Airflow_Temperature_Cel
+        data[14..26].copy_from_slice(&[190, 0x22, 0, 56, 44, 44, 0, 56, 56, 12, 0, 0]);
+        assert_eq!(smart_attrib_temp(&data), Some(44));
+
+        // 194 Temperature_Celsius, after 190
+        data[26..38].copy_from_slice(&[194, 0x02, 0, 171, 171, 35, 0, 13, 0, 45, 0, 0]);
+        assert_eq!(smart_attrib_temp(&data), Some(44));
+
+        // 194 Temperature_Celsius, first
+        data[14..26].copy_from_slice(&[194, 0x02, 0, 171, 171, 35, 0, 13, 0, 45, 0, 0]);
+        assert_eq!(smart_attrib_temp(&data), Some(35));
+    }
+}
@@ -128,6 +128,13 @@ pub(crate) enum Command {
         #[arg(short, long)]
         interval: humantime::Duration,
 
+        /// Minimum interval to check temperature and adjust fan speed, ie. '10s'.
+        /// If set, the interval adapts between this value and the -i/--interval value,
+        /// shorter when drive temperature is high or changes fast.
+        /// Only drive temperatures are considered, not -w/--hwmons probes.
+        #[arg(long)]
+        min_interval: Option<humantime::Duration>,
+
         /// Also control fan speed according to these additional hwmon temperature probes.
         /// Format is `HWMON_PATH[:TEMP_MIN_SPEED:TEMP_MAX_SPEED]`
         /// (ie. `/sys/devices/platform/coretemp.0/hwmon/hwmonX/tempY_input:45:75`).
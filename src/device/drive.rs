@@ -2,12 +2,22 @@
 
 use std::{
     fmt,
-    io::BufRead as _,
+    fs::{self, File},
     os::unix::prelude::FileTypeExt as _,
     path::{Path, PathBuf},
     process::{Command, Stdio},
+    str,
+    sync::Arc,
 };
 
+use crate::ata;
+
+/// Prefix of hdparm output line with drive state
+const STATE_LINE_PREFIX: &str = "drive state is: ";
+
+/// Sysfs block device class directory
+const SYSFS_BLOCK_DIR: &str = "/sys/block";
+
 /// Drive runtime state
 #[derive(strum::EnumString, strum::Display)]
 #[strum(serialize_all = "lowercase")]
@@ -24,6 +34,17 @@ pub(crate) enum State {
 }
 
 impl State {
+    /// Decode ATA CHECK POWER MODE sector count register
+    fn from_power_mode(mode: u8) -> Self {
+        match mode {
+            // Standby_z, Standby_y
+            0x00 | 0x01 => State::Standby,
+            // Idle, Idle_a, Idle_b, Idle_c, Active or Idle
+            0x80..=0x83 | 0xff => State::ActiveIdle,
+            _ => State::Unknown,
+        }
+    }
+
     /// Is drive currently spun down
     pub(crate) fn is_spun_down(&self) -> bool {
         match self {
@@ -39,6 +60,8 @@ pub(crate) struct Drive {
     pub dev_path: PathBuf,
     /// Pretty name for display
     name: String,
+    /// Opened device if it supports ATA commands through `SG_IO`
+    ata_dev: Option<Arc<File>>,
 }
 
 impl fmt::Display for Drive {
@@ -55,15 +78,47 @@ impl Drive {
             dev_path.metadata()?.file_type().is_block_device(),
             "Path {dev_path:?} is not a block device",
         );
+        let ata_dev = ata::open(&dev_path)
+            .and_then(|f| {
+                ata::check_power_mode(&f)?;
+                Ok(f)
+            })
+            .inspect_err(|e| {
+                log::info!("Drive {dev_path:?} does not support SG_IO power mode query, falling back to hdparm: {e}");
+            })
+            .ok()
+            .map(Arc::new);
+        // Avoid spawning processes to get model if drive can be queried directly
+        let model = match ata_dev.as_deref().map(ata::identify_model) {
+            Some(Ok(model)) => model,
+            // sysfs model may be truncated or be the one of the USB bridge, so use it only as a last resort
+            _ => Self::model(&dev_path)
+                .or_else(|_| Self::sysfs_model(&dev_path, Path::new(SYSFS_BLOCK_DIR)))?,
+        };
         let name = format!(
             "{} {}",
             dev_path
                 .file_name()
                 .and_then(|p| p.to_str())
                 .ok_or_else(|| anyhow::anyhow!("Invalid drive path"))?,
-            Self::model(&dev_path)?,
+            model,
         );
-        Ok(Self { dev_path, name })
+        Ok(Self {
+            dev_path,
+            name,
+            ata_dev,
+        })
+    }
+
+    /// Get drive model name from sysfs, under the given block device class directory
+    fn sysfs_model(path: &Path, sysfs_block_dir: &Path) -> anyhow::Result<String> {
+        let name = path
+            .file_name()
+            .ok_or_else(|| anyhow::anyhow!("Invalid device path"))?;
+        let model_path = sysfs_block_dir.join(name).join("device/model");
+        let model = fs::read_to_string(model_path)?.trim().to_owned();
+        anyhow::ensure!(!model.is_empty(), "Empty model name for drive {path:?}");
+        Ok(model)
     }
 
     /// Get drive model name
@@ -85,12 +140,15 @@ impl Drive {
                 continue;
             }
             // log::trace!("{}", std::str::from_utf8(&output.stdout).unwrap());
-            if let Some(line) = output.stdout.lines().map_while(Result::ok).find(|l| {
-                let l = l.trim_start();
-                l.starts_with("Model Number:") || l.starts_with("Product:")
-            }) {
-                #[expect(clippy::unwrap_used)] // We know string contains ':'
-                return Ok(line.split_once(':').unwrap().1.trim().to_owned());
+            if let Some(model) = String::from_utf8_lossy(&output.stdout)
+                .lines()
+                .find_map(|l| {
+                    let l = l.trim_start();
+                    l.strip_prefix("Model Number:")
+                        .or_else(|| l.strip_prefix("Product:"))
+                })
+            {
+                return Ok(model.trim().to_owned());
             }
         }
         anyhow::bail!("Unable to get drive {path:?} model name");
@@ -113,25 +171,32 @@ impl Drive {
             "hdparm failed with code {}",
             output.status
         );
-        let state = output
-            .stdout
+        let state = str::from_utf8(&output.stdout)?
             .lines()
-            .map_while(Result::ok)
-            .filter(|l| l.trim_start().starts_with("drive state is: "))
-            .find_map(|l| {
-                l.split_ascii_whitespace()
-                    .next_back()
-                    .map(ToOwned::to_owned)
-            })
+            .find_map(|l| l.trim_start().strip_prefix(STATE_LINE_PREFIX))
             .ok_or_else(|| anyhow::anyhow!("Failed to parse hdparm drive state output"))?
+            .trim()
             .parse()
             .unwrap_or(State::Unknown);
         Ok(state)
     }
 
+    /// Opened device if it supports ATA commands through `SG_IO`
+    pub(crate) fn ata_dev(&self) -> Option<&Arc<File>> {
+        self.ata_dev.as_ref()
+    }
+
+    /// Does getting drive state spawn a process
+    pub(crate) fn state_spawns_process(&self) -> bool {
+        self.ata_dev.is_none()
+    }
+
     /// Get drive runtime state
     pub(crate) fn state(&self) -> anyhow::Result<State> {
-        Self::state_(&self.dev_path)
+        match &self.ata_dev {
+            Some(f) => Ok(State::from_power_mode(ata::check_power_mode(f)?)),
+            None => Self::state_(&self.dev_path),
+        }
     }
 }
 
@@ -167,6 +232,38 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_sysfs_model() {
+        let sysfs_dir = tempfile::tempdir().unwrap();
+        let dev_dir = sysfs_dir.path().join("_sdX").join("device");
+        fs::create_dir_all(&dev_dir).unwrap();
+
+        fs::write(dev_dir.join("model"), "WDC WD4003FZEX-0\n").unwrap();
+        assert_eq!(
+            Drive::sysfs_model(Path::new("/dev/_sdX"), sysfs_dir.path()).unwrap(),
+            "WDC WD4003FZEX-0"
+        );
+
+        fs::write(dev_dir.join("model"), "   \n").unwrap();
+        assert!(Drive::sysfs_model(Path::new("/dev/_sdX"), sysfs_dir.path()).is_err());
+
+        assert!(Drive::sysfs_model(Path::new("/dev/_sdY"), sysfs_dir.path()).is_err());
+    }
+
+    #[test]
+    fn test_state_from_power_mode() {
+        assert!(matches!(State::from_power_mode(0x00), State::Standby));
+        assert!(matches!(State::from_power_mode(0x01), State::Standby));
+        assert!(matches!(State::from_power_mode(0x80), State::ActiveIdle));
+        assert!(matches!(State::from_power_mode(0x81), State::ActiveIdle));
+        assert!(matches!(State::from_power_mode(0x82), State::ActiveIdle));
+        assert!(matches!(State::from_power_mode(0x83), State::ActiveIdle));
+        assert!(matches!(State::from_power_mode(0xff), State::ActiveIdle));
+        assert!(matches!(State::from_power_mode(0x40), State::Unknown));
+        assert!(matches!(State::from_power_mode(0x41), State::Unknown));
+        assert!(matches!(State::from_power_mode(0x84), State::Unknown));
+    }
+
     #[serial_test::serial]
     #[test]
     fn test_state() {
@@ -3,20 +3,22 @@
 use core::fmt;
 use std::{
     cmp::{max, min},
-    fs,
+    fs::{self, File},
     ops::Range,
     path::{Path, PathBuf},
 };
 
 use crate::{
     probe::{DeviceTempProber, Temp},
-    sysfs::{ensure_sysfs_dir, ensure_sysfs_file},
+    sysfs::{ensure_sysfs_dir, ensure_sysfs_file, read_file_value},
 };
 
 /// A linux whmon temp probe
 pub(crate) struct Hwmon {
     /// Sysfs temperature probe path
     input_path: PathBuf,
+    /// Opened sysfs temperature probe file
+    input: File,
     /// Kernel device name
     device: String,
     /// Probe index
@@ -51,6 +53,7 @@ impl Hwmon {
             .parse::<usize>()?;
         Ok(Self {
             input_path: input_path.to_owned(),
+            input: File::open(input_path)?,
             device,
             num,
         })
@@ -92,11 +95,6 @@ impl Hwmon {
         })
     }
 
-    /// Read a sysfs temp probe
-    fn read_sysfs_temp(path: &Path) -> anyhow::Result<Temp> {
-        Ok(f64::from(Self::read_sysfs_temp_milli(path)?) / 1000.0)
-    }
-
     /// Read a sysfs temp probe
     fn read_sysfs_temp_milli(path: &Path) -> anyhow::Result<u32> {
         Ok(fs::read_to_string(path)?.trim_end().parse()?)
@@ -105,6 +103,6 @@ impl Hwmon {
 
 impl DeviceTempProber for Hwmon {
     fn probe_temp(&mut self) -> anyhow::Result<Temp> {
-        Self::read_sysfs_temp(&self.input_path)
+        Ok(f64::from(read_file_value::<u32>(&self.input)?) / 1000.0)
     }
 }
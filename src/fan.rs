@@ -12,7 +12,7 @@ use std::{
 use crate::{
     cl::PwmSettings,
     probe::Temp,
-    pwm::{self, ControlMode, Pwm},
+    pwm::{self, ControlMode, Pwm, RpmFile},
 };
 
 /// Minimum duration to apply fan startup boost
@@ -39,8 +39,12 @@ pub(crate) struct Fan<T> {
     pwm: Pwm<T>,
     /// Pwm thresholds
     thresholds: Thresholds,
+    /// PWM value range above stop threshold
+    pwm_span: f64,
     /// Current speed
     speed: Option<Speed>,
+    /// Last PWM value written
+    pwm_value: Option<pwm::Value>,
     /// Startup ts
     startup: Option<Instant>,
 }
@@ -108,7 +112,9 @@ impl Fan<()> {
         Ok(Self {
             pwm,
             thresholds: pwm_info.thresholds.clone(),
+            pwm_span: f64::from(pwm::Value::MAX - pwm_info.thresholds.max_stop),
             speed: None,
+            pwm_value: None,
             startup: None,
         })
     }
@@ -181,11 +187,13 @@ impl Fan<()> {
     }
 
     /// Build a new instance with PWM RPM file set
-    pub(crate) fn with_rpm_file(self, path: &Path) -> anyhow::Result<Fan<PathBuf>> {
+    pub(crate) fn with_rpm_file(self, path: &Path) -> anyhow::Result<Fan<RpmFile>> {
         Ok(Fan {
             pwm: self.pwm.with_rpm_file(path)?,
             thresholds: self.thresholds,
+            pwm_span: self.pwm_span,
             speed: self.speed,
+            pwm_value: self.pwm_value,
             startup: self.startup,
         })
     }
@@ -198,9 +206,7 @@ impl<T> Fan<T> {
         if speed.is_zero() {
             pwm::Value::MIN
         } else {
-            self.thresholds.max_stop
-                + (f64::from(pwm::Value::MAX - self.thresholds.max_stop) * speed.0.get())
-                    as pwm::Value
+            self.thresholds.max_stop + (self.pwm_span * speed.0.get()) as pwm::Value
         }
     }
 
@@ -211,6 +217,8 @@ impl<T> Fan<T> {
             let new_mode = ControlMode::Software;
             if prev_mode != new_mode {
                 self.pwm.set_mode(new_mode)?;
+                // Value may have been changed while in the other mode, so force the next write
+                self.pwm_value = None;
                 log::info!(
                     "PWM {} mode set from {} to {}",
                     self.pwm,
@@ -231,7 +239,12 @@ impl<T> Fan<T> {
             } else {
                 pwm_value
             };
-            self.pwm.set(pwm_value)?;
+            if self.pwm_value == Some(pwm_value) {
+                log::trace!("PWM {} value unchanged: {}", self.pwm, pwm_value);
+            } else {
+                self.pwm.set(pwm_value)?;
+                self.pwm_value = Some(pwm_value);
+            }
             log::info!("Fan {self} speed set to {speed}");
             self.speed = Some(speed);
         } else {
@@ -241,7 +254,7 @@ impl<T> Fan<T> {
     }
 }
 
-impl Fan<PathBuf> {
+impl Fan<RpmFile> {
     /// Wait until fan speed stop increasing or decreasing
     fn wait_stable(&self, change: SpeedChange) -> anyhow::Result<()> {
         /// Maximum duration to wait for the fan to be stabilized
@@ -339,9 +352,9 @@ pub(crate) fn target_speed(temp: Temp, temp_range: &Range<Temp>, min_speed: Spee
 #[cfg(test)]
 mod tests {
 
-    use std::io::Write as _;
+    use std::fs;
 
-    use self::pwm::tests::{assert_file_content, FakePwm};
+    use self::pwm::tests::{assert_file_content, assert_file_empty, FakePwm};
     use super::*;
 
     #[test]
@@ -427,7 +440,7 @@ mod tests {
 
     #[test]
     fn test_set_speed() {
-        let mut fake_pwm = FakePwm::new();
+        let fake_pwm = FakePwm::new();
         let mut fan = Fan::new(&PwmSettings {
             filepath: fake_pwm.pwm_path.clone(),
             thresholds: Thresholds {
@@ -437,51 +450,57 @@ mod tests {
         })
         .unwrap();
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.0.try_into().unwrap()).unwrap();
         assert_eq!(fan.startup, None);
-        assert_file_content(&mut fake_pwm.val_file_read, "0\n");
+        assert_file_content(&fake_pwm.pwm_path, "0\n");
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.01.try_into().unwrap()).unwrap();
         assert!(fan.startup.is_some());
-        assert_file_content(&mut fake_pwm.val_file_read, "200\n");
+        assert_file_content(&fake_pwm.pwm_path, "200\n");
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.5.try_into().unwrap()).unwrap();
         assert!(fan.startup.is_some());
-        assert_file_content(&mut fake_pwm.val_file_read, "200\n");
+        assert_file_empty(&fake_pwm.pwm_path);
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.9.try_into().unwrap()).unwrap();
         assert!(fan.startup.is_some());
-        assert_file_content(&mut fake_pwm.val_file_read, "239\n");
+        assert_file_content(&fake_pwm.pwm_path, "239\n");
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(1.0.try_into().unwrap()).unwrap();
         assert!(fan.startup.is_some());
-        assert_file_content(&mut fake_pwm.val_file_read, "255\n");
+        assert_file_content(&fake_pwm.pwm_path, "255\n");
 
         fan.startup = None;
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.5.try_into().unwrap()).unwrap();
         assert_eq!(fan.startup, None);
-        assert_file_content(&mut fake_pwm.val_file_read, "177\n");
+        assert_file_content(&fake_pwm.pwm_path, "177\n");
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.01.try_into().unwrap()).unwrap();
         assert_eq!(fan.startup, None);
-        assert_file_content(&mut fake_pwm.val_file_read, "101\n");
+        assert_file_content(&fake_pwm.pwm_path, "101\n");
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.0.try_into().unwrap()).unwrap();
         assert_eq!(fan.startup, None);
-        assert_file_content(&mut fake_pwm.val_file_read, "0\n");
+        assert_file_content(&fake_pwm.pwm_path, "0\n");
 
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         fan.set_speed(0.01.try_into().unwrap()).unwrap();
         assert!(fan.startup.is_some());
-        assert_file_content(&mut fake_pwm.val_file_read, "200\n");
+        assert_file_content(&fake_pwm.pwm_path, "200\n");
+
+        // Mode was reset externally, same PWM value must be written again
+        fs::write(&fake_pwm.mode_path, b"2\n").unwrap();
+        fan.set_speed(0.02.try_into().unwrap()).unwrap();
+        assert!(fan.startup.is_some());
+        assert_file_content(&fake_pwm.pwm_path, "200\n");
     }
 }
@@ -6,11 +6,11 @@
 )]
 
 use std::{
+    cmp::max,
     ops::Range,
-    sync::{
-        atomic::{AtomicBool, Ordering},
-        mpsc, Arc,
-    },
+    panic,
+    sync::mpsc,
+    thread,
     time::{Duration, Instant},
 };
 
@@ -19,12 +19,15 @@ use clap::Parser as _;
 use device::Hwmon;
 use exit::ExitHook;
 use fan::Speed;
+use poll::AdaptiveInterval;
 use probe::Temp;
 
+mod ata;
 mod cl;
 mod device;
 mod exit;
 mod fan;
+mod poll;
 mod probe;
 mod pwm;
 mod sysfs;
@@ -33,9 +36,83 @@ mod tests;
 
 use crate::{device::Drive, fan::Fan, probe::DeviceTempProber};
 
-/// Interruptible sleep
-fn sleep(dur: Duration, exit_rx: &mpsc::Receiver<()>) {
-    let _ = exit_rx.recv_timeout(dur);
+/// Interruptible sleep, return true if exit was requested
+fn sleep(dur: Duration, exit_rx: &mpsc::Receiver<()>) -> bool {
+    exit_rx.recv_timeout(dur).is_ok()
+}
+
+/// Probe drive temperature, or return None if it is spun down
+fn probe_drive(
+    prober: &mut dyn DeviceTempProber,
+    supports_probing_sleeping: bool,
+    drive: &Drive,
+) -> anyhow::Result<Option<Temp>> {
+    // State is only needed to avoid waking up the drive
+    if !supports_probing_sleeping {
+        let state = drive.state()?;
+        log::debug!("Drive {drive} state: {state}");
+        if state.is_spun_down() {
+            log::debug!("Drive {drive} is sleeping");
+            return Ok(None);
+        }
+    }
+    let temp = prober.probe_temp()?;
+    log::debug!("Drive {drive}: {temp}°C");
+    Ok(Some(temp))
+}
+
+/// Probe all drives, and return the max temperature, or None if they are all spun down
+///
+/// Probes that spawn a process are run in their own thread so that the total duration is not the
+/// sum of each probe duration, the others are run in the current thread.
+fn probe_drives(
+    drive_probers: &mut [(Box<dyn DeviceTempProber>, bool)],
+    drives: &[Drive],
+) -> anyhow::Result<Option<Temp>> {
+    let is_slow =
+        |prober: &dyn DeviceTempProber, supports_probing_sleeping: bool, drive: &Drive| {
+            prober.spawns_process() || (!supports_probing_sleeping && drive.state_spawns_process())
+        };
+    // No need for threads if at most one probe is slow
+    let concurrent = drive_probers
+        .iter()
+        .zip(drives.iter())
+        .filter(|((prober, supports_probing_sleeping), drive)| {
+            is_slow(prober.as_ref(), *supports_probing_sleeping, drive)
+        })
+        .count()
+        > 1;
+    let temps = thread::scope(|scope| {
+        let mut temps = Vec::with_capacity(drives.len());
+        let mut handles = Vec::new();
+        for ((prober, supports_probing_sleeping), drive) in
+            drive_probers.iter_mut().zip(drives.iter())
+        {
+            if concurrent && is_slow(prober.as_ref(), *supports_probing_sleeping, drive) {
+                handles.push(scope.spawn(move || {
+                    probe_drive(prober.as_mut(), *supports_probing_sleeping, drive)
+                }));
+            } else {
+                temps.push(probe_drive(
+                    prober.as_mut(),
+                    *supports_probing_sleeping,
+                    drive,
+                ));
+            }
+        }
+        temps.extend(
+            handles
+                .into_iter()
+                .map(|h| h.join().unwrap_or_else(|e| panic::resume_unwind(e))),
+        );
+        temps
+    });
+    Ok(temps
+        .into_iter()
+        .collect::<anyhow::Result<Vec<_>>>()?
+        .into_iter()
+        .flatten()
+        .reduce(f64::max))
 }
 
 #[cfg(feature = "gen-man-pages")]
@@ -85,6 +162,7 @@ fn main() -> anyhow::Result<()> {
             drive_temp_range,
             min_fan_speed_prct,
             interval,
+            min_interval,
             hwmons,
             restore_fan_settings,
         } => {
@@ -92,15 +170,28 @@ fn main() -> anyhow::Result<()> {
                 start: drive_temp_range[0],
                 end: drive_temp_range[1],
             };
+            let mut adaptive_interval = min_interval
+                .map(|min_interval| -> anyhow::Result<_> {
+                    anyhow::ensure!(
+                        !min_interval.is_zero() && (min_interval <= interval),
+                        "Minimum interval must be non zero, and not greater than interval"
+                    );
+                    Ok(AdaptiveInterval::new(Range {
+                        start: *min_interval,
+                        end: *interval,
+                    }))
+                })
+                .transpose()?;
             let drives: Vec<Drive> = drive_paths
                 .iter()
                 .map(|path| Drive::new(path))
                 .collect::<anyhow::Result<_>>()?;
+            let probe_methods = probe::methods(hddtemp_daemon_port);
             let mut drive_probers: Vec<(Box<dyn DeviceTempProber>, bool)> = drives
                 .iter()
                 .zip(drive_paths.iter())
                 .map(|(drive, path)| {
-                    probe::prober(drive, hddtemp_daemon_port)?.ok_or_else(|| {
+                    probe::prober(drive, &probe_methods)?.ok_or_else(|| {
                         anyhow::anyhow!("No probing method found for drive {path:?}")
                     })
                 })
@@ -138,39 +229,17 @@ fn main() -> anyhow::Result<()> {
             )?;
 
             // Signal handling
-            let exit_requested = Arc::new(AtomicBool::new(false));
             let (exit_tx, exit_rx) = mpsc::channel::<()>();
-            {
-                let exit_requested = Arc::clone(&exit_requested);
-                ctrlc::set_handler(move || {
-                    exit_requested.store(true, Ordering::SeqCst);
-                    let _ = exit_tx.send(());
-                })?;
-            }
+            ctrlc::set_handler(move || {
+                let _ = exit_tx.send(());
+            })?;
 
-            while !exit_requested.load(Ordering::SeqCst) {
+            // Absolute time of next cycle start, so that the cycle period does not drift
+            let mut next_cycle = Instant::now();
+            loop {
                 let start = Instant::now();
 
-                let max_drive_temp = drive_probers
-                    .iter_mut()
-                    .zip(drives.iter())
-                    .map(|((prober, supports_probing_sleeping), drive)| {
-                        let state = drive.state()?;
-                        log::debug!("Drive {drive} state: {state}");
-                        let temp = if state.is_spun_down() && !*supports_probing_sleeping {
-                            log::debug!("Drive {drive} is sleeping");
-                            None
-                        } else {
-                            let temp = prober.probe_temp()?;
-                            log::debug!("Drive {drive}: {temp}°C");
-                            Some(temp)
-                        };
-                        Ok(temp)
-                    })
-                    .collect::<anyhow::Result<Vec<_>>>()?
-                    .into_iter()
-                    .flatten()
-                    .reduce(f64::max);
+                let max_drive_temp = probe_drives(&mut drive_probers, &drives)?;
 
                 let hwmon_temps: Vec<Temp> = hwmon_and_range
                     .iter_mut()
@@ -197,10 +266,17 @@ fn main() -> anyhow::Result<()> {
                     fan.set_speed(speed)?;
                 }
 
-                let elapsed = Instant::now().duration_since(start);
-                let to_wait = interval.saturating_sub(elapsed);
+                let cur_interval = adaptive_interval.as_mut().map_or(*interval, |i| {
+                    i.next(max_drive_temp, &drive_temp_range, start)
+                });
+                // If the cycle overran, start the next one right away, without trying to catch up
+                let now = Instant::now();
+                next_cycle = max(next_cycle + cur_interval, now);
+                let to_wait = next_cycle.duration_since(now);
                 log::debug!("Will sleep at most {to_wait:?}");
-                sleep(to_wait, &exit_rx);
+                if sleep(to_wait, &exit_rx) {
+                    break;
+                }
             }
         }
     }
@@ -0,0 +1,144 @@
+//! Adaptive polling interval
+
+use std::{
+    ops::Range,
+    time::{Duration, Instant},
+};
+
+use crate::probe::Temp;
+
+/// Polling interval that shortens when drive temperature is high or changes fast
+pub(crate) struct AdaptiveInterval {
+    /// Minimum and maximum intervals
+    range: Range<Duration>,
+    /// Previous temperature, and when it was measured
+    prev: Option<(Temp, Instant)>,
+}
+
+impl AdaptiveInterval {
+    /// Build a new adaptive interval
+    pub(crate) fn new(range: Range<Duration>) -> Self {
+        Self { range, prev: None }
+    }
+
+    /// Compute next interval from the current max drive temperature
+    ///
+    /// `temp` is None if all drives are spun down, in which case the full interval is returned.
+    pub(crate) fn next(
+        &mut self,
+        temp: Option<Temp>,
+        temp_range: &Range<Temp>,
+        now: Instant,
+    ) -> Duration {
+        let Some(temp) = temp else {
+            self.prev = None;
+            return self.range.end;
+        };
+        let slope = self.prev.map_or(0.0, |(prev_temp, prev_ts)| {
+            let dt = now.duration_since(prev_ts).as_secs_f64();
+            if dt > 0.0 {
+                (temp - prev_temp) / dt
+            } else {
+                0.0
+            }
+        });
+        self.prev = Some((temp, now));
+        let factor = interval_factor(temp, slope, temp_range);
+        self.range.start + (self.range.end - self.range.start).mul_f64(factor)
+    }
+}
+
+/// Compute interval factor in [0.0; 1.0] from temperature headroom, and temperature slope in °C/s
+fn interval_factor(temp: Temp, slope: f64, temp_range: &Range<Temp>) -> f64 {
+    if temp_range.is_empty() {
+        // No headroom to compute, poll as often as allowed
+        return 0.0;
+    }
+    let headroom = ((temp_range.end - temp) / (temp_range.end - temp_range.start)).clamp(0.0, 1.0);
+    let stability = 1.0 / (1.0 + slope.abs() * 60.0);
+    headroom * stability
+}
+
+#[cfg(test)]
+mod tests {
+    use float_cmp::approx_eq;
+
+    use super::*;
+
+    #[test]
+    fn test_interval_factor() {
+        let range = Range {
+            start: 30.0,
+            end: 50.0,
+        };
+        assert!(approx_eq!(f64, interval_factor(25.0, 0.0, &range), 1.0));
+        assert!(approx_eq!(f64, interval_factor(30.0, 0.0, &range), 1.0));
+        assert!(approx_eq!(f64, interval_factor(40.0, 0.0, &range), 0.5));
+        assert!(approx_eq!(f64, interval_factor(50.0, 0.0, &range), 0.0));
+        assert!(approx_eq!(f64, interval_factor(55.0, 0.0, &range), 0.0));
+        assert!(approx_eq!(
+            f64,
+            interval_factor(30.0, 1.0 / 60.0, &range),
+            0.5
+        ));
+        assert!(approx_eq!(
+            f64,
+            interval_factor(30.0, -1.0 / 60.0, &range),
+            0.5
+        ));
+    }
+
+    #[test]
+    fn test_interval_factor_empty_range() {
+        let range = Range {
+            start: 40.0,
+            end: 40.0,
+        };
+        assert!(approx_eq!(f64, interval_factor(35.0, 0.0, &range), 0.0));
+        assert!(approx_eq!(f64, interval_factor(40.0, 0.0, &range), 0.0));
+        assert!(approx_eq!(f64, interval_factor(45.0, 0.0, &range), 0.0));
+
+        let mut interval = AdaptiveInterval::new(Range {
+            start: Duration::from_secs(10),
+            end: Duration::from_secs(60),
+        });
+        assert_eq!(
+            interval.next(Some(40.0), &range, Instant::now()),
+            Duration::from_secs(10)
+        );
+    }
+
+    #[test]
+    fn test_next() {
+        let temp_range = Range {
+            start: 30.0,
+            end: 50.0,
+        };
+        let mut interval = AdaptiveInterval::new(Range {
+            start: Duration::from_secs(10),
+            end: Duration::from_secs(60),
+        });
+        let now = Instant::now();
+
+        assert_eq!(
+            interval.next(Some(30.0), &temp_range, now),
+            Duration::from_secs(60)
+        );
+        assert_eq!(
+            interval.next(Some(30.0), &temp_range, now + Duration::from_secs(60)),
+            Duration::from_secs(60)
+        );
+        assert_eq!(
+            interval.next(Some(31.0), &temp_range, now + Duration::from_secs(120)),
+            Duration::from_millis(33_750)
+        );
+        assert_eq!(
+            interval.next(Some(60.0), &temp_range, now + Duration::from_secs(180)),
+            Duration::from_secs(10)
+        );
+        assert_eq!(
+            interval.next(None, &temp_range, now + Duration::from_secs(240)),
+            Duration::from_secs(60)
+        );
+    }
+}
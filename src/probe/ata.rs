@@ -0,0 +1,48 @@
+//! In process ATA SMART attribute temperature probing
+
+use std::{fmt, fs::File, sync::Arc};
+
+use super::{DeviceTempProber, Drive, DriveTempProbeMethod, ProberError, Temp};
+use crate::ata;
+
+/// ATA SMART attribute temperature probing method, sent through `SG_IO`
+pub(crate) struct Method;
+
+impl DriveTempProbeMethod for Method {
+    fn prober(&self, drive: &Drive) -> Result<Box<dyn DeviceTempProber>, ProberError> {
+        let mut prober = Prober {
+            device: drive.ata_dev().map(Arc::clone).ok_or_else(|| {
+                ProberError::Unsupported("Drive does not support SG_IO".to_owned())
+            })?,
+        };
+        prober
+            .probe_temp()
+            .map_err(|e| ProberError::Unsupported(e.to_string()))?;
+        Ok(Box::new(prober))
+    }
+
+    fn supports_probing_sleeping(&self) -> bool {
+        false
+    }
+}
+
+impl fmt::Display for Method {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> Result<(), fmt::Error> {
+        write!(f, "ATA SMART attribute")
+    }
+}
+
+/// ATA SMART attribute temperature prober
+pub(crate) struct Prober {
+    /// Opened block device, shared with the drive
+    device: Arc<File>,
+}
+
+impl DeviceTempProber for Prober {
+    fn probe_temp(&mut self) -> anyhow::Result<Temp> {
+        let data = ata::smart_read_data(&self.device)?;
+        let temp = ata::smart_attrib_temp(&data)
+            .ok_or_else(|| anyhow::anyhow!("No temperature SMART attribute"))?;
+        Ok(Temp::from(temp))
+    }
+}
@@ -2,11 +2,13 @@
 //! See <https://docs.kernel.org/hwmon/drivetemp.html>
 
 use std::{
-    fmt, fs,
-    path::{Path, PathBuf},
+    fmt,
+    fs::{self, File},
+    path::Path,
 };
 
 use super::{DeviceTempProber, Drive, DriveTempProbeMethod, ProberError, Temp};
+use crate::sysfs::read_file_value;
 
 /// Drivetemp native kernel temperature probing method
 pub(crate) struct Method;
@@ -41,7 +43,8 @@ impl DriveTempProbeMethod for Method {
                         "{input_path:?} does not exist"
                     )));
                 }
-                return Ok(Box::new(Prober { input_path }));
+                let input = File::open(&input_path).map_err(|e| ProberError::Other(e.into()))?;
+                return Ok(Box::new(Prober { input }));
             }
         }
         Err(ProberError::Unsupported(format!(
@@ -62,17 +65,13 @@ impl fmt::Display for Method {
 
 /// Drivetemp kernel temperature prober
 pub(crate) struct Prober {
-    /// Sysfs file, ie `temp1_input`
-    input_path: PathBuf,
+    /// Opened sysfs file, ie `temp1_input`
+    input: File,
 }
 
 impl DeviceTempProber for Prober {
     fn probe_temp(&mut self) -> anyhow::Result<Temp> {
-        Ok(f64::from(
-            fs::read_to_string(&self.input_path)?
-                .trim_end()
-                .parse::<u32>()?,
-        ) / 1000.0)
+        Ok(f64::from(read_file_value::<u32>(&self.input)?) / 1000.0)
     }
 }
 
@@ -88,7 +87,7 @@ mod tests {
     fn test_probe_temp() {
         let mut input_file = tempfile::NamedTempFile::new().unwrap();
         let mut prober = Prober {
-            input_path: input_file.path().to_owned(),
+            input: File::open(input_file.path()).unwrap(),
         };
         input_file.write_all("54321\n".as_bytes()).unwrap();
         assert!(approx_eq!(f64, prober.probe_temp().unwrap(), 54.321));
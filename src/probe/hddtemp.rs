@@ -1,12 +1,15 @@
 //! Hddtemp temperature probing
 
 use std::{
+    collections::HashMap,
     fmt,
     io::Read as _,
     net::{SocketAddrV4, TcpStream},
     path::PathBuf,
     process::{Command, Stdio},
     str,
+    sync::{Arc, Mutex, PoisonError},
+    time::{Duration, Instant},
 };
 
 use itertools::Itertools as _;
@@ -16,7 +19,19 @@ use super::{DeviceTempProber, Drive, DriveTempProbeMethod, ProberError, Temp};
 /// Hddtemp daemon probing method
 pub(crate) struct DaemonMethod {
     /// Daemon address
-    pub addr: SocketAddrV4,
+    addr: SocketAddrV4,
+    /// Last daemon report, shared by the probers of all drives
+    report: Arc<Mutex<Option<DaemonReport>>>,
+}
+
+impl DaemonMethod {
+    /// Build method for daemon at given address
+    pub(crate) fn new(addr: SocketAddrV4) -> Self {
+        Self {
+            addr,
+            report: Arc::new(Mutex::new(None)),
+        }
+    }
 }
 
 impl DriveTempProbeMethod for DaemonMethod {
@@ -24,6 +39,8 @@ impl DriveTempProbeMethod for DaemonMethod {
         let mut prober = DaemonProber {
             addr: self.addr,
             device: drive.dev_path.clone(),
+            report: Arc::clone(&self.report),
+            report_max_age: DAEMON_REPORT_MAX_AGE,
         };
         prober
             .probe_temp()
@@ -42,40 +59,77 @@ impl fmt::Display for DaemonMethod {
     }
 }
 
+/// Maximum age of a daemon report to be reused by other drives, so that the daemon is queried once per cycle
+const DAEMON_REPORT_MAX_AGE: Duration = Duration::from_secs(1);
+
+/// Initial capacity of the daemon report buffer, enough for most reports to be read without reallocating
+const DAEMON_REPORT_CAPACITY: usize = 4096;
+
+/// Hddtemp daemon report
+struct DaemonReport {
+    /// When the report was received
+    ts: Instant,
+    /// Temperature by device path
+    temps: HashMap<String, anyhow::Result<Temp>>,
+}
+
+impl DaemonReport {
+    /// Query daemon and parse its report
+    fn fetch(addr: SocketAddrV4) -> anyhow::Result<Self> {
+        let mut stream = TcpStream::connect(addr)?;
+        let mut buf = String::with_capacity(DAEMON_REPORT_CAPACITY);
+        stream.read_to_string(&mut buf)?;
+        let mut temps = HashMap::new();
+        for (_, dev, _, temp, unit) in buf.split('|').tuples() {
+            temps
+                .entry(dev.to_owned())
+                .or_insert_with(|| Self::parse_temp(temp, unit));
+        }
+        Ok(Self {
+            ts: Instant::now(),
+            temps,
+        })
+    }
+
+    /// Parse temperature value and unit
+    fn parse_temp(temp: &str, unit: &str) -> anyhow::Result<Temp> {
+        let temp: Temp = temp.parse()?;
+        match unit {
+            "C" => Ok(temp),
+            "F" => Ok((temp - 32.0) / 1.8),
+            _ => anyhow::bail!("Unexpected temp unit {unit:?}"),
+        }
+    }
+}
+
 /// Hddtemp daemon temperature prober
 pub(crate) struct DaemonProber {
     /// Daemon address
     addr: SocketAddrV4,
     /// Device path in /dev/
     device: PathBuf,
+    /// Last daemon report, shared with the probers of other drives
+    report: Arc<Mutex<Option<DaemonReport>>>,
+    /// Maximum age of the report to be reused
+    report_max_age: Duration,
 }
 
 impl DeviceTempProber for DaemonProber {
     fn probe_temp(&mut self) -> anyhow::Result<Temp> {
-        let mut stream = TcpStream::connect(self.addr)?;
-        let mut buf = String::new();
-        stream.read_to_string(&mut buf)?;
-        for chunk in &buf.split('|').chunks(5) {
-            let tokens: Vec<_> = chunk.collect();
-            if tokens.len() < 5 {
-                break;
-            }
-            let dev = tokens[1];
-            // At this point we have already converted the device path to string
-            #[expect(clippy::unwrap_used)]
-            if dev != self.device.to_str().unwrap() {
-                continue;
-            }
-            let mut temp = tokens[3].parse()?;
-            let unit = tokens[4];
-            if unit == "F" {
-                temp = (temp - 32.0) / 1.8;
-            } else if unit != "C" {
-                anyhow::bail!("Unexpected temp unit {unit:?}");
-            }
-            return Ok(temp);
+        let dev = self
+            .device
+            .to_str()
+            .ok_or_else(|| anyhow::anyhow!("Invalid device path"))?;
+        let mut report = self.report.lock().unwrap_or_else(PoisonError::into_inner);
+        let report = match report.take() {
+            Some(r) if r.ts.elapsed() < self.report_max_age => report.insert(r),
+            _ => report.insert(DaemonReport::fetch(self.addr)?),
+        };
+        match report.temps.get(dev) {
+            Some(Ok(temp)) => Ok(*temp),
+            Some(Err(e)) => anyhow::bail!("{e:#}"),
+            None => anyhow::bail!("No temperature found for device {:?}", self.device),
         }
-        anyhow::bail!("No temperature found for device {:?}", self.device);
     }
 }
 
@@ -134,6 +188,10 @@ impl DeviceTempProber for InvocationProber {
         let temp = str::from_utf8(&output.stdout)?.trim_end().parse()?;
         Ok(temp)
     }
+
+    fn spawns_process(&self) -> bool {
+        true
+    }
 }
 
 #[expect(clippy::shadow_unrelated)]
@@ -183,6 +241,8 @@ mod tests {
         let mut prober = DaemonProber {
             addr,
             device: PathBuf::from("/dev/_sdz"),
+            report: Arc::new(Mutex::new(None)),
+            report_max_age: Duration::ZERO,
         };
 
         msg_tx.send(b"|/dev/_sdz|DriveSDZ|30|C|".to_vec()).unwrap();
@@ -215,6 +275,27 @@ mod tests {
 
         msg_tx.send(b"|/dev/_sdz|DriveSDZ|86|F|".to_vec()).unwrap();
         assert!(approx_eq!(f64, prober.probe_temp().unwrap(), 30.0));
+
+        // Report is shared with other drives while fresh enough
+        let report = Arc::new(Mutex::new(None));
+        let mut prober = DaemonProber {
+            addr,
+            device: PathBuf::from("/dev/_sdz"),
+            report: Arc::clone(&report),
+            report_max_age: Duration::from_secs(60),
+        };
+        let mut prober2 = DaemonProber {
+            addr,
+            device: PathBuf::from("/dev/_sdy"),
+            report,
+            report_max_age: Duration::from_secs(60),
+        };
+        msg_tx
+            .send(b"|/dev/_sdy|DriveSDY|31|C||/dev/_sdz|DriveSDZ|30|C|".to_vec())
+            .unwrap();
+        assert!(approx_eq!(f64, prober.probe_temp().unwrap(), 30.0));
+        assert!(approx_eq!(f64, prober2.probe_temp().unwrap(), 31.0));
+        assert!(approx_eq!(f64, prober.probe_temp().unwrap(), 30.0));
     }
 
     #[serial_test::serial]
@@ -2,14 +2,17 @@
 
 use std::{
     fmt,
-    io::BufRead as _,
     path::PathBuf,
     process::{Command, Stdio},
+    str,
 };
 
 use super::{DeviceTempProber, DriveTempProbeMethod, ProberError, Temp};
 use crate::device::Drive;
 
+/// Prefix of the hdparm output line with the temperature
+const TEMP_LINE_PREFIX: &str = "drive temperature (celsius) is: ";
+
 /// Hdparm Hitachi/HGST temperature probing method
 pub(crate) struct Method;
 
@@ -58,34 +61,26 @@ impl DeviceTempProber for Prober {
             "hdparm failed with code {}",
             output.status
         );
-        let lines: Vec<_> = output
-            .stdout
-            .lines()
-            .chain(output.stderr.lines())
-            .collect::<Result<_, _>>()?;
+        let stdout = str::from_utf8(&output.stdout)?;
+        let stderr = str::from_utf8(&output.stderr)?;
+        let lines = || stdout.lines().chain(stderr.lines());
         // See https://github.com/Distrotech/hdparm/blob/4517550db29a91420fb2b020349523b1b4512df2/sgio.c#L308-L315
         // for some soft errors
         anyhow::ensure!(
-            !lines
-                .iter()
-                .any(|l| l.starts_with("SG_IO: ") && l.contains("sense data")),
+            !lines().any(|l| l.starts_with("SG_IO: ") && l.contains("sense data")),
             "hdparm returned soft error",
         );
-        let temp = lines
-            .iter()
-            .filter(|l| {
-                l.trim_start()
-                    .starts_with("drive temperature (celsius) is: ")
-            })
-            .find_map(|l| {
-                l.split_ascii_whitespace()
-                    .next_back()
-                    .map(ToOwned::to_owned)
-            })
+        let temp = lines()
+            .find_map(|l| l.trim_start().strip_prefix(TEMP_LINE_PREFIX))
             .ok_or_else(|| anyhow::anyhow!("Failed to parse hdparm temp output"))?
+            .trim()
             .parse()?;
         Ok(temp)
     }
+
+    fn spawns_process(&self) -> bool {
+        true
+    }
 }
 
 #[expect(clippy::shadow_unrelated)]
@@ -1,5 +1,6 @@
 //! Temperature probing
 
+mod ata;
 mod drivetemp;
 mod hddtemp;
 mod hdparm;
@@ -36,26 +37,39 @@ pub(crate) trait DriveTempProbeMethod: fmt::Display {
 }
 
 /// Device temperature prober
-pub(crate) trait DeviceTempProber {
+pub(crate) trait DeviceTempProber: Send {
     /// Get current drive temperature
     fn probe_temp(&mut self) -> anyhow::Result<Temp>;
+
+    /// Does probing spawn a process, and is thus slow enough to be worth running concurrently
+    fn spawns_process(&self) -> bool {
+        false
+    }
 }
 
-/// Find first supported prober for a drive
-pub(crate) fn prober(
-    drive: &Drive,
-    hddtemp_daemon_port: u16,
-) -> anyhow::Result<Option<(Box<dyn DeviceTempProber>, bool)>> {
-    let methods: [Box<dyn DriveTempProbeMethod>; 6] = [
+/// Build all probing methods, in order of preference
+///
+/// Methods are built once and shared by all drives, so they can share state between probers.
+pub(crate) fn methods(hddtemp_daemon_port: u16) -> [Box<dyn DriveTempProbeMethod>; 7] {
+    [
         Box::new(drivetemp::Method),
         Box::new(hdparm::Method),
         Box::new(smartctl::SctMethod),
-        Box::new(hddtemp::DaemonMethod {
-            addr: SocketAddrV4::new(Ipv4Addr::LOCALHOST, hddtemp_daemon_port),
-        }),
+        Box::new(ata::Method),
+        Box::new(hddtemp::DaemonMethod::new(SocketAddrV4::new(
+            Ipv4Addr::LOCALHOST,
+            hddtemp_daemon_port,
+        ))),
         Box::new(hddtemp::InvocationMethod),
         Box::new(smartctl::AttribMethod),
-    ];
+    ]
+}
+
+/// Find first supported prober for a drive
+pub(crate) fn prober(
+    drive: &Drive,
+    methods: &[Box<dyn DriveTempProbeMethod>],
+) -> anyhow::Result<Option<(Box<dyn DeviceTempProber>, bool)>> {
     for method in methods {
         match method.prober(drive) {
             Ok(p) => {
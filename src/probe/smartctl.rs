@@ -2,10 +2,9 @@
 
 use std::{
     fmt,
-    io::BufRead as _,
     path::PathBuf,
     process::{Command, Stdio},
-    str::FromStr,
+    str,
 };
 
 use super::{DeviceTempProber, Drive, DriveTempProbeMethod, ProberError, Temp};
@@ -60,21 +59,18 @@ impl DeviceTempProber for SctProber {
             "smartctl failed with code {}",
             output.status
         );
-        let temp = output
-            .stdout
+        let temp = str::from_utf8(&output.stdout)?
             .lines()
-            .map_while(Result::ok)
             .filter(|l| l.starts_with("Current Temperature: "))
-            .find_map(|l| {
-                l.split_ascii_whitespace()
-                    .rev()
-                    .nth(1)
-                    .map(ToOwned::to_owned)
-            })
+            .find_map(|l| l.split_ascii_whitespace().rev().nth(1))
             .ok_or_else(|| anyhow::anyhow!("Failed to parse smartctl SCT temp output"))?
             .parse()?;
         Ok(temp)
     }
+
+    fn spawns_process(&self) -> bool {
+        true
+    }
 }
 
 /// Smartctl SMART attribute temperature probing method
@@ -109,37 +105,36 @@ pub(crate) struct AttribProber {
 }
 
 /// SMART attribute log, as parsed from smartctl output
-struct SmartAttribLog {
+struct SmartAttribLog<'a> {
     /// Attribute id
     id: u16,
     /// Attribute name
-    name: String,
+    name: &'a str,
     /// Attribute value
     value: u32,
 }
 
-impl FromStr for SmartAttribLog {
-    type Err = &'static str;
+impl<'a> TryFrom<&'a str> for SmartAttribLog<'a> {
+    type Error = &'static str;
 
-    /// Parse log from smartctl -A output
-    fn from_str(s: &str) -> Result<Self, Self::Err> {
-        let tokens: Vec<_> = s.split_ascii_whitespace().collect();
-        if tokens.len() < 10 {
+    /// Parse log from smartctl -A output line
+    fn try_from(s: &'a str) -> Result<Self, Self::Error> {
+        let mut tokens = s.split_ascii_whitespace();
+        let (Some(id), Some(name), Some(value)) = (tokens.next(), tokens.next(), tokens.nth(7))
+        else {
             return Err("No enough columns");
-        }
+        };
         Ok(Self {
-            id: tokens[0]
-                .parse()
-                .map_err(|_| "Unable to parse attribute id")?,
-            name: tokens[1].to_owned(),
-            value: tokens[9]
+            id: id.parse().map_err(|_| "Unable to parse attribute id")?,
+            name,
+            value: value
                 .parse()
                 .map_err(|_| "Unable to parse attribute value")?,
         })
     }
 }
 
-impl SmartAttribLog {
+impl SmartAttribLog<'_> {
     /// Get temp if this attribute has it, or None
     fn temp(&self) -> Option<Temp> {
         /// Known temp attributes
@@ -174,16 +169,18 @@ impl DeviceTempProber for AttribProber {
             "smartctl failed with code {}",
             output.status
         );
-        let temp = output
-            .stdout
+        let temp = str::from_utf8(&output.stdout)?
             .lines()
-            .map_while(Result::ok)
-            .find_map(|l| l.parse::<SmartAttribLog>().ok().and_then(|a| a.temp()))
+            .find_map(|l| SmartAttribLog::try_from(l).ok().and_then(|a| a.temp()))
             .ok_or_else(|| {
                 anyhow::anyhow!("Failed to parse smartctl attribute output, or no temp attribute")
             })?;
         Ok(temp)
     }
+
+    fn spawns_process(&self) -> bool {
+        true
+    }
 }
 
 #[expect(clippy::shadow_unrelated)]
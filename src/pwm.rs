@@ -4,28 +4,37 @@
 
 use std::{
     fmt,
+    fs::File,
     io::{self, ErrorKind},
     path::{Path, PathBuf},
+    sync::Arc,
     time::Duration,
 };
 
 use backoff::ExponentialBackoffBuilder;
 
-use crate::sysfs::{ensure_sysfs_dir, ensure_sysfs_file, read_value, write_value};
+use crate::sysfs::{
+    ensure_sysfs_dir, ensure_sysfs_file, open_rw, read_file_value, write_file_value,
+};
 
 /// PWM sysfs value
 pub(crate) type Value = u8;
 
+/// Opened `fanX_input` sysfs file
+pub(crate) type RpmFile = Arc<File>;
+
 /// Stateless PWM control
-/// T is the type of RPM file path
+/// T is the type of RPM file
 #[derive(Clone)]
 pub(crate) struct Pwm<T> {
     /// pwmX sysfs filepath
     val: PathBuf,
-    /// `fanX_input` sysfs filepath
+    /// Opened pwmX sysfs file
+    val_file: Arc<File>,
+    /// `fanX_input` sysfs file
     rpm: T,
-    /// `pwmX_enable` sysfs filepath
-    mode: PathBuf,
+    /// Opened `pwmX_enable` sysfs file
+    mode_file: Arc<File>,
     /// Kernel device name (different from PWM name)
     device: String,
     /// Index among driver
@@ -109,9 +118,7 @@ impl Pwm<()> {
             .to_str()
             .ok_or_else(|| anyhow::anyhow!("Invalid path: {path:?}"))?;
         let num = val_path_fname
-            .chars()
-            .skip_while(|c| !c.is_ascii_digit())
-            .collect::<String>()
+            .trim_start_matches(|c: char| !c.is_ascii_digit())
             .parse::<usize>()?;
         let mode_path =
             ensure_sysfs_file(&path.with_file_name(format!("{val_path_fname}_enable")))?;
@@ -123,20 +130,26 @@ impl Pwm<()> {
             .ok_or_else(|| anyhow::anyhow!("Invalid device name {path:?}"))?
             .to_owned();
         Ok(Self {
-            val: path.clone(),
+            val_file: Arc::new(open_rw(&path)?),
+            val: path,
             rpm: (),
-            mode: mode_path,
+            mode_file: Arc::new(open_rw(&mode_path).or_else(|e| {
+                // Some drivers expose a read only enable file, the mode can then only be read
+                log::warn!("Unable to open {mode_path:?} for writing, control mode will not be changed: {e}");
+                File::open(&mode_path)
+            })?),
             device,
             num,
         })
     }
 
-    /// Build a new PWM with RPM file path set
-    pub(crate) fn with_rpm_file(self, rpm_path: &Path) -> anyhow::Result<Pwm<PathBuf>> {
+    /// Build a new PWM with RPM file set
+    pub(crate) fn with_rpm_file(self, rpm_path: &Path) -> anyhow::Result<Pwm<RpmFile>> {
         Ok(Pwm {
             val: self.val,
-            rpm: ensure_sysfs_file(rpm_path)?,
-            mode: self.mode,
+            val_file: self.val_file,
+            rpm: Arc::new(File::open(ensure_sysfs_file(rpm_path)?)?),
+            mode_file: self.mode_file,
             device: self.device,
             num: self.num,
         })
@@ -153,22 +166,22 @@ impl<T> Pwm<T> {
     /// Set PWM value
     pub(crate) fn set(&self, val: Value) -> anyhow::Result<()> {
         log::trace!("Set PWM {self} to {val}");
-        write_value(&self.val, val)
+        write_file_value(&self.val_file, val)
     }
 
     /// Get PWM value
     pub(crate) fn get(&self) -> anyhow::Result<Value> {
-        read_value(&self.val)
+        read_file_value(&self.val_file)
     }
 
     /// Get PWM control mode
     pub(crate) fn get_mode(&self) -> anyhow::Result<ControlMode> {
-        Ok(read_value::<u8>(&self.mode)?.into())
+        Ok(read_file_value::<u8>(&self.mode_file)?.into())
     }
 
     /// Set PWM control mode
     pub(crate) fn set_mode(&self, mode: ControlMode) -> anyhow::Result<()> {
-        write_value::<u8>(&self.mode, mode.into())
+        write_file_value::<u8>(&self.mode_file, mode.into())
     }
 
     /// Get current state
@@ -187,10 +200,10 @@ impl<T> Pwm<T> {
     }
 }
 
-impl Pwm<PathBuf> {
+impl Pwm<RpmFile> {
     /// Get fan RPM value
     pub(crate) fn get_rpm(&self) -> anyhow::Result<u32> {
-        read_value(&self.rpm)
+        read_file_value(&self.rpm)
     }
 }
 
@@ -203,14 +216,10 @@ impl<T> fmt::Display for Pwm<T> {
 #[cfg(test)]
 pub(crate) mod tests {
     use std::{
-        fs::{create_dir, File, OpenOptions},
-        io::Read as _,
-        os::unix::{fs::symlink, prelude::OpenOptionsExt as _},
-        str,
+        fs::{self, create_dir, File},
+        os::unix::fs::symlink,
     };
 
-    use io::Write as _;
-    use nix::{libc::O_NONBLOCK, sys::stat, unistd::mkfifo};
     use tempfile::TempDir;
 
     use super::*;
@@ -218,13 +227,8 @@ pub(crate) mod tests {
     pub(crate) struct FakePwm {
         _dir: TempDir,
         pub pwm_path: PathBuf,
-        pub val_file_read: File,
-        val_file_write: File,
         pub rpm_path: PathBuf,
-        _rpm_file_read: File,
-        rpm_file_write: File,
-        mode_file_read: File,
-        pub mode_file_write: File,
+        pub mode_path: PathBuf,
     }
 
     impl FakePwm {
@@ -233,31 +237,13 @@ pub(crate) mod tests {
             let dir = TempDir::new().unwrap();
 
             let pwm_path = dir.path().join("pwm2");
-            mkfifo(&pwm_path, stat::Mode::from_bits(0o600).unwrap()).unwrap();
-            let val_file_read = OpenOptions::new()
-                .read(true)
-                .custom_flags(O_NONBLOCK)
-                .open(&pwm_path)
-                .unwrap();
-            let val_file_write = File::create(&pwm_path).unwrap();
+            File::create(&pwm_path).unwrap();
 
             let rpm_path = dir.path().join("fan2_input");
-            mkfifo(&rpm_path, stat::Mode::from_bits(0o600).unwrap()).unwrap();
-            let rpm_file_read = OpenOptions::new()
-                .read(true)
-                .custom_flags(O_NONBLOCK)
-                .open(&rpm_path)
-                .unwrap();
-            let rpm_file_write = File::create(&rpm_path).unwrap();
+            File::create(&rpm_path).unwrap();
 
             let mode_path = dir.path().join("pwm2_enable");
-            mkfifo(&mode_path, stat::Mode::from_bits(0o600).unwrap()).unwrap();
-            let mode_file_read = OpenOptions::new()
-                .read(true)
-                .custom_flags(O_NONBLOCK)
-                .open(&mode_path)
-                .unwrap();
-            let mode_file_write = File::create(&mode_path).unwrap();
+            File::create(&mode_path).unwrap();
 
             let device_path = dir.path().join("device_name");
             create_dir(&device_path).unwrap();
@@ -267,75 +253,74 @@ pub(crate) mod tests {
             Self {
                 _dir: dir,
                 pwm_path,
-                val_file_read,
-                val_file_write,
                 rpm_path,
-                _rpm_file_read: rpm_file_read,
-                rpm_file_write,
-                mode_file_read,
-                mode_file_write,
+                mode_path,
             }
         }
     }
 
-    pub(crate) fn assert_file_content(file: &mut File, content: &str) {
-        let mut buf = [0; 16];
-        let count = file.read(&mut buf).unwrap();
-        let s = str::from_utf8(&buf[..count]).unwrap();
-        assert_eq!(s, content);
+    /// Check file content, and clear it to detect the next write
+    pub(crate) fn assert_file_content(path: &Path, content: &str) {
+        assert_eq!(fs::read_to_string(path).unwrap(), content);
+        File::create(path).unwrap();
+    }
+
+    /// Check nothing was written to file since it was last cleared
+    pub(crate) fn assert_file_empty(path: &Path) {
+        assert_eq!(fs::read_to_string(path).unwrap(), "");
     }
 
     #[test]
     fn test_set() {
-        let mut fake_pwm = FakePwm::new();
+        let fake_pwm = FakePwm::new();
         let pwm = Pwm::new(&fake_pwm.pwm_path).unwrap();
         pwm.set(123).unwrap();
-        assert_file_content(&mut fake_pwm.val_file_read, "123\n");
+        assert_file_content(&fake_pwm.pwm_path, "123\n");
     }
 
     #[test]
     fn test_get() {
-        let mut fake_pwm = FakePwm::new();
+        let fake_pwm = FakePwm::new();
         let pwm = Pwm::new(&fake_pwm.pwm_path).unwrap();
-        fake_pwm.val_file_write.write_all(b"124\n").unwrap();
+        fs::write(&fake_pwm.pwm_path, b"124\n").unwrap();
         assert_eq!(pwm.get().unwrap(), 124);
     }
 
     #[test]
     fn test_get_rpm() {
-        let mut fake_pwm = FakePwm::new();
+        let fake_pwm = FakePwm::new();
         let pwm = Pwm::new(&fake_pwm.pwm_path)
             .unwrap()
             .with_rpm_file(&fake_pwm.rpm_path)
             .unwrap();
-        fake_pwm.rpm_file_write.write_all(b"1234\n").unwrap();
+        fs::write(&fake_pwm.rpm_path, b"1234\n").unwrap();
         assert_eq!(pwm.get_rpm().unwrap(), 1234);
     }
 
     #[test]
     fn test_get_mode() {
-        let mut fake_pwm = FakePwm::new();
+        let fake_pwm = FakePwm::new();
         let pwm = Pwm::new(&fake_pwm.pwm_path).unwrap();
-        fake_pwm.mode_file_write.write_all(b"0\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"0\n").unwrap();
         assert_eq!(pwm.get_mode().unwrap(), ControlMode::Off);
-        fake_pwm.mode_file_write.write_all(b"1\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"1\n").unwrap();
         assert_eq!(pwm.get_mode().unwrap(), ControlMode::Software);
-        fake_pwm.mode_file_write.write_all(b"2\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"2\n").unwrap();
         assert_eq!(pwm.get_mode().unwrap(), ControlMode::Other(2));
-        fake_pwm.mode_file_write.write_all(b"3\n").unwrap();
+        fs::write(&fake_pwm.mode_path, b"3\n").unwrap();
         assert_eq!(pwm.get_mode().unwrap(), ControlMode::Other(3));
     }
 
     #[test]
     fn test_set_mode() {
-        let mut fake_pwm = FakePwm::new();
+        let fake_pwm = FakePwm::new();
         let pwm = Pwm::new(&fake_pwm.pwm_path).unwrap();
         pwm.set_mode(ControlMode::Off).unwrap();
-        assert_file_content(&mut fake_pwm.mode_file_read, "0\n");
+        assert_file_content(&fake_pwm.mode_path, "0\n");
         pwm.set_mode(ControlMode::Software).unwrap();
-        assert_file_content(&mut fake_pwm.mode_file_read, "1\n");
+        assert_file_content(&fake_pwm.mode_path, "1\n");
         pwm.set_mode(ControlMode::Other(2)).unwrap();
-        assert_file_content(&mut fake_pwm.mode_file_read, "2\n");
+        assert_file_content(&fake_pwm.mode_path, "2\n");
     }
 
     #[test]
@@ -3,28 +3,17 @@
 use std::{
     error::Error,
     fmt,
-    fs::File,
-    io::{Read as _, Write as _},
-    os::linux::fs::MetadataExt as _,
+    fs::{File, OpenOptions},
+    io,
+    os::unix::fs::FileExt as _,
     path::{Path, PathBuf},
     str::{self, FromStr},
 };
 
-use nix::sys::stat;
-
 /// Ensure path is a valid sysfs file path, and normalizes it
 pub(crate) fn ensure_sysfs_file(path: &Path) -> anyhow::Result<PathBuf> {
     let path = path.canonicalize()?;
-    anyhow::ensure!(
-        if cfg!(test) {
-            path.is_file()
-                || (path.exists()
-                    && (path.metadata()?.st_mode() & stat::SFlag::S_IFIFO.bits()) != 0)
-        } else {
-            path.is_file()
-        },
-        "{path:?} missing or not a file"
-    );
+    anyhow::ensure!(path.is_file(), "{path:?} missing or not a file");
     Ok(path)
 }
 
@@ -35,26 +24,62 @@ pub(crate) fn ensure_sysfs_dir(path: &Path) -> anyhow::Result<PathBuf> {
     Ok(path)
 }
 
-/// Write integer value to path
-pub(crate) fn write_value<T>(path: &Path, val: T) -> anyhow::Result<()>
+/// Open sysfs file to read and write values
+pub(crate) fn open_rw(path: &Path) -> io::Result<File> {
+    OpenOptions::new().read(true).write(true).open(path)
+}
+
+/// Write integer value to an already opened file
+///
+/// Sysfs attributes ignore the file offset on write, value is written at offset 0 so there is no need to seek.
+pub(crate) fn write_file_value<T>(file: &File, val: T) -> anyhow::Result<()>
 where
     T: fmt::Display,
 {
-    let mut f = File::create(path)?;
-    f.write_all(format!("{val}\n").as_bytes())?;
+    file.write_all_at(format!("{val}\n").as_bytes(), 0)?;
     Ok(())
 }
 
-/// Read integer value from path
-pub(crate) fn read_value<T>(path: &Path) -> anyhow::Result<T>
+/// Read integer value from an already opened file, without reopening or seeking it
+pub(crate) fn read_file_value<T>(file: &File) -> anyhow::Result<T>
 where
     T: FromStr + PartialEq + Copy,
     <T as FromStr>::Err: Error + Send + Sync,
     <T as FromStr>::Err: 'static,
 {
-    let mut file = File::open(path)?;
     let mut buf = [0; 16];
-    let count = file.read(&mut buf)?;
-    let s = str::from_utf8(&buf[..count])?.trim_end();
+    let count = file.read_at(&mut buf, 0)?;
+    parse_value(&buf[..count])
+}
+
+/// Parse integer value from sysfs file content
+fn parse_value<T>(buf: &[u8]) -> anyhow::Result<T>
+where
+    T: FromStr,
+    <T as FromStr>::Err: Error + Send + Sync,
+    <T as FromStr>::Err: 'static,
+{
+    let s = str::from_utf8(buf)?.trim_end();
     Ok(s.parse::<T>()?)
 }
+
+#[cfg(test)]
+mod tests {
+    use std::io::{Seek as _, Write as _};
+
+    use super::*;
+
+    #[test]
+    fn test_read_file_value() {
+        let mut tmp_file = tempfile::NamedTempFile::new().unwrap();
+        let file = File::open(tmp_file.path()).unwrap();
+
+        tmp_file.write_all(b"1234\n").unwrap();
+        assert_eq!(read_file_value::<u32>(&file).unwrap(), 1234);
+        assert_eq!(read_file_value::<u32>(&file).unwrap(), 1234);
+
+        tmp_file.rewind().unwrap();
+        tmp_file.write_all(b"5678\n").unwrap();
+        assert_eq!(read_file_value::<u32>(&file).unwrap(), 5678);
+    }
+}